@@ -14,21 +14,136 @@ Usage:
     # Take single snapshot
     result = client.take_snapshot(camera_id=1)
     
-    # Take synchronized multi-camera snapshots
-    result = client.take_multiple_snapshots([1, 2, 3])
+    # Take synchronized snapshots from all cameras
+    result = client.take_all_snapshots()
 """
 
+import asyncio
+import aiofiles
+import aiohttp
 import requests
-import json
-import time
-from typing import List, Dict, Any, Optional, Union
-from pathlib import Path
-import base64
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.decoder import (
+    ImproperBodyPartContentException,
+    MultipartDecoder,
+    NonMultipartContentTypeException,
+)
+from urllib3.util.retry import Retry
 import io
-from PIL import Image
-from datetime import datetime
+import logging
+import orjson
+import os
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
+import pybase64
+
+
+logger = logging.getLogger(__name__)
+
+
+def _image_format(image_data: bytes) -> str:
+    """Guess the file extension of an encoded image from its magic bytes."""
+    if image_data[:3] == b'\xff\xd8\xff':
+        return "jpeg"
+    if image_data[:8] == b'\x89PNG\r\n\x1a\n':
+        return "png"
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return "webp"
+    return "bin"
+
+
+def _load_json(response: requests.Response) -> Any:
+    """Parse a JSON response with orjson, raising the same error as response.json()."""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+def _decode_snapshot(snapshot_data: Union[str, bytes]) -> bytes:
+    """Decode a base64 snapshot, with or without a data URL prefix. Raw bytes are returned as they are."""
+    if isinstance(snapshot_data, bytes):
+        return snapshot_data
+
+    # Rimuovi prefisso data URL se presente
+    head, sep, body = snapshot_data.partition(",")
+    if sep and head.startswith("data:"):
+        snapshot_data = body
+
+    # Decodifica base64 con validazione
+    return pybase64.b64decode(snapshot_data, validate=True)
+
+
+def _snapshot_dir(dirname: Optional[str] = None) -> Path:
+    """Create and return the 'snapshots/dirname' folder (or just 'snapshots' if dirname is None)."""
+    # Base path: current working dir + 'snapshots' + optional dirname
+    base_path = Path.cwd() / "snapshots"
+    if dirname:
+        base_path = base_path / dirname
+    base_path.mkdir(parents=True, exist_ok=True)
+    return base_path
+
+
+def _timestamp() -> str:
+    """Local time formatted for snapshot file names, e.g. 20250101_120000_123456."""
+    now = time.time()
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1_000_000) % 1_000_000:06d}"
+
+
+def _save_archive(items: List[Tuple[int, Union[str, bytes]]], archive_path: Union[str, Path]):
+    """Append several snapshots to a single tar archive instead of one file each.
+
+    The archive is created if missing; images of earlier calls are kept.
+    """
+    try:
+        archive_path = Path(archive_path)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        timestamp = _timestamp()
+
+        # tarfile cannot append to a zero-length file, so start those afresh
+        mode = "a" if archive_path.is_file() and archive_path.stat().st_size else "w"
+
+        with tarfile.open(archive_path, mode=mode) as tf:
+            for camera_id, snapshot_data in items:
+                try:
+                    if not snapshot_data:
+                        continue
+
+                    image_data = _decode_snapshot(snapshot_data)
+                    tarinfo = tarfile.TarInfo(f"camera_{camera_id}_{timestamp}.{_image_format(image_data)}")
+                    tarinfo.size = len(image_data)
+                    tarinfo.mtime = int(time.time())
+                    tf.addfile(tarinfo, io.BytesIO(image_data))
+
+                except Exception as e:
+                    logger.warning("Failed to add snapshot to archive: %s", e)
+
+        logger.debug("Snapshot archive saved locally: %s", archive_path)
+
+    except Exception as e:
+        logger.warning("Failed to save snapshot archive locally: %s", e)
+
+
+def _parse_images(images: List[Dict[str, Any]]) -> Dict[int, Union[str, bytes]]:
+    """Map camera_id -> image data from a snapshot_all/snapshot_stereo 'data' list."""
+    snapshots = {}
+
+    for image_info in images:
+        camera_id_str = image_info.get("stream_id")
+        image_data = image_info.get("image_data")
+        if camera_id_str is None or image_data is None:
+            continue  # skip invalid entries
+        try:
+            camera_id = int(camera_id_str)
+            snapshots[camera_id] = image_data
+        except (ValueError, TypeError):
+            continue  # skip malformed IDs
+
+    return snapshots
 
 
 class SnapshotError(Exception):
@@ -43,24 +158,72 @@ class SnapshotClient:
     Provides easy-to-use methods for taking synchronized snapshots
     from single or multiple cameras.
     """
+
+    # Successful health checks, shared by all clients: server_url -> (monotonic time, status)
+    _health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    HEALTH_CACHE_TTL = 30.0
+
+    # One pooled session per server, shared by all clients pointing at it
+    _shared_sessions: Dict[str, requests.Session] = {}
+    _shared_sessions_lock = threading.Lock()
     
-    def __init__(self, server_url: str = "http://localhost:5001", timeout: int = 300):
+    def __init__(self, server_url: str = "http://localhost:5001", timeout: int = 300,
+                 verify: bool = True):
         """
         Initialize the snapshot client.
         
         Args:
             server_url: URL of the snapshot server (default: http://localhost:5001)
             timeout: Request timeout in seconds (default: 30)
+            verify: Check that the server is reachable (default: True). A check
+                    that succeeded in the last HEALTH_CACHE_TTL seconds is reused.
         """
         self.server_url = server_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = self._session_for(self.server_url)
+
+        # Disk writes run in the background so the next image can be decoded meanwhile
+        self._save_pool = ThreadPoolExecutor(max_workers=2)
         
-        # Test connection
+        if verify:
+            self._check_connection()
+
+    @classmethod
+    def _session_for(cls, server_url: str) -> requests.Session:
+        """Return the session shared by all clients of server_url, creating it on first use."""
+        with cls._shared_sessions_lock:
+            session = cls._shared_sessions.get(server_url)
+            if session is None:
+                session = requests.Session()
+
+                # Keep connections alive and size the pool for burst/multi-camera use.
+                # Neither 504 nor read errors are retried: both come after the server
+                # has already asked the viewer for a capture, and retrying would
+                # trigger another capture and another full wait.
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, read=0, backoff_factor=0.2,
+                                      status_forcelist=[502, 503])
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["Connection"] = "keep-alive"
+
+                cls._shared_sessions[server_url] = session
+            return session
+
+    def _check_connection(self):
+        """Test the connection to the server, unless it was checked recently."""
+        cached = self._health_cache.get(self.server_url)
+        if cached and time.monotonic() - cached[0] < self.HEALTH_CACHE_TTL:
+            return
+
         try:
             response = self.session.get(f"{self.server_url}/api/health", timeout=5)
             if response.status_code != 200:
                 raise SnapshotError(f"Server not responding correctly: {response.status_code}")
+            self._health_cache[self.server_url] = (time.monotonic(), _load_json(response))
         except requests.RequestException as e:
             raise SnapshotError(f"Cannot connect to snapshot server: {e}")
     
@@ -74,7 +237,7 @@ class SnapshotClient:
         try:
             response = self.session.get(f"{self.server_url}/api/health", timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return _load_json(response)
         except requests.RequestException as e:
             raise SnapshotError(f"Failed to get server status: {e}")
     
@@ -98,9 +261,9 @@ class SnapshotClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = _load_json(response)
             
-            if (result):
+            if save_locally and result:
                 self._save_locally(result['image'], camera_id, "single")
             
             return result
@@ -109,41 +272,30 @@ class SnapshotClient:
             raise SnapshotError(f"Failed to take snapshot from camera {camera_id}: {e}")
 
     
-    def take_all_snapshots(self, save_locally: bool = True, local_path: Optional[str] = None) -> Dict[int, str]:
+    def take_all_snapshots(self, save_locally: bool = True, local_path: Optional[str] = None,
+                           binary: bool = False,
+                           archive_path: Optional[Union[str, Path]] = None) -> Dict[int, Union[str, bytes]]:
         """
         Take snapshots from all cameras via /api/snapshot_all.
 
         Args:
             save_locally: Whether to save images locally
             local_path: Custom local path to save the images
+            binary: Fetch raw image bytes as multipart/mixed instead of base64 in JSON
+            archive_path: Append all images to this single .tar file instead of one file each
+                (created if missing; earlier images in it are kept)
 
         Returns:
-            Dictionary mapping camera_id -> base64 image string
+            Dictionary mapping camera_id -> base64 image string (raw bytes if binary)
         """
         try:
-            response = self.session.get(
-                f"{self.server_url}/api/snapshot_all",
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
+            snapshots = self._get_images("/api/snapshot_all", binary)
 
-            images =  result.get('images', {}).get('data', [])
-
-            snapshots = {}
-
-            for image_info in images:
-                camera_id_str = image_info["stream_id"]
-                image_data = image_info["image_data"]
-                if camera_id_str is None or image_data is None:
-                    continue  # skip invalid entries
-                try:
-                    camera_id = int(camera_id_str)
-                    if save_locally:
-                        self._save_locally(image_data, camera_id, "all")
-                    snapshots[camera_id] = image_data
-                except (ValueError, TypeError):
-                    continue  # skip malformed IDs
+            if save_locally and snapshots:
+                if archive_path:
+                    _save_archive(list(snapshots.items()), archive_path)
+                else:
+                    self._save_locally_many(list(snapshots.items()), "all")
 
             return snapshots
 
@@ -151,81 +303,147 @@ class SnapshotClient:
             raise SnapshotError(f"Failed to take all snapshots: {e}")
 
     
-    def take_snapshot_stereo(self, save_locally: bool = True, local_path: Optional[str] = None) -> Dict[int, dict]:
+    def take_snapshot_stereo(self, save_locally: bool = True, local_path: Optional[str] = None,
+                             binary: bool = False) -> Dict[int, Union[str, bytes]]:
         """
         Take a stereo snapshot (camera 1 and 2 simultaneously) via /api/snapshot_stereo.
 
         Args:
             save_locally: Whether to save the images locally
             local_path: Optional path to save the images
+            binary: Fetch raw image bytes as multipart/mixed instead of base64 in JSON
 
         Returns:
             Dictionary mapping camera ID -> snapshot data
         """
         try:
+            snapshots = self._get_images("/api/snapshot_stereo", binary)
+
+            if save_locally and snapshots:
+                self._save_locally_many(list(snapshots.items()), "stereo")
+
+            return snapshots
+
+        except requests.RequestException as e:
+            raise SnapshotError(f"Failed to take stereo snapshots: {e}")
+
+
+    def _get_images(self, path: str, binary: bool = False) -> Dict[int, Union[str, bytes]]:
+        """Fetch a multi-camera snapshot endpoint and map camera_id -> image data."""
+        if binary:
             response = self.session.get(
-                f"{self.server_url}/api/snapshot_stereo",
+                f"{self.server_url}{path}",
+                headers={"Accept": "multipart/mixed"},
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            try:
+                parts = MultipartDecoder.from_response(response).parts
+            except NonMultipartContentTypeException as e:
+                raise SnapshotError(f"Expected a multipart response: {e}")
+            except ImproperBodyPartContentException as e:
+                # With no camera image the server sends only the closing
+                # boundary, which the decoder rejects instead of yielding no parts
+                if b"\r\n\r\n" not in response.content:
+                    return {}
+                raise SnapshotError(f"Malformed multipart response: {e}")
+            return _parse_images([
+                {"stream_id": part.headers.get(b"X-Stream-Id"), "image_data": part.content}
+                for part in parts
+            ])
+
+        response = self.session.get(
+            f"{self.server_url}{path}",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        result = _load_json(response)
+        return _parse_images(result.get('images', {}).get('data', []))
+
+    def take_burst_snapshots(self, count: int, interval: float = 0.0,
+                             save_locally: bool = True) -> List[Dict[int, str]]:
+        """
+        Take a burst of snapshots from all cameras.
 
-            images = result.get("images", {}).get("data", {})
+        The requests run concurrently, each one started `interval` seconds
+        after the previous, so the burst lasts about one round-trip plus
+        (count - 1) * interval instead of count * (round-trip + interval).
 
-            snapshots = {}
+        Args:
+            count: Number of snapshots in the burst
+            interval: Delay in seconds between the start of consecutive snapshots
+            save_locally: Whether to save images locally
 
-            for image_info in images:
-                camera_id_str = image_info["stream_id"]
-                image_data = image_info["image_data"]
-                if camera_id_str is None or image_data is None:
-                    continue  # skip invalid entries
-                try:
-                    camera_id = int(camera_id_str)
-                    if save_locally:
-                        self._save_locally(image_data, camera_id, "stereo")
-                    snapshots[camera_id] = image_data
-                except (ValueError, TypeError):
-                    continue  # skip malformed IDs
+        Returns:
+            List of take_all_snapshots results, in burst order
+        """
+        if count <= 0:
+            return []
 
-            return snapshots
+        def take_one(index: int) -> Dict[int, str]:
+            time.sleep(index * interval)
+            return self.take_all_snapshots(save_locally=save_locally)
 
-        except requests.RequestException as e:
-            raise SnapshotError(f"Failed to take stereo snapshots: {e}")
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(take_one, range(count)))
 
 
     def _save_locally(self, snapshot_data: str, camera_id: int, dirname: Optional[str] = None):
         """Save snapshot data locally inside 'snapshots/dirname' folder (or just 'snapshots' if dirname is None)."""
+        self._save_locally_many([(camera_id, snapshot_data)], dirname)
+
+    def _save_locally_many(self, items: List[Tuple[int, Union[str, bytes]]], dirname: Optional[str] = None):
+        """Save several snapshots into the same folder, creating it and computing the timestamp only once."""
         try:
-            if snapshot_data:
-                # Rimuovi prefisso data URL se presente
-                if snapshot_data.startswith("data:"):
-                    snapshot_data = snapshot_data.split(",", 1)[1]
+            base_path = _snapshot_dir(dirname)
+
+            # Un solo timestamp per tutto il batch
+            timestamp = _timestamp()
+        except Exception as e:
+            logger.warning("Failed to save snapshot locally: %s", e)
+            return
 
-                # Decodifica base64 con validazione
-                image_data = base64.b64decode(snapshot_data, validate=True)
+        futures = []
+        for camera_id, snapshot_data in items:
+            try:
+                if not snapshot_data:
+                    continue
 
-                # Apri immagine con PIL per determinare formato
-                image = Image.open(io.BytesIO(image_data))
-                image_format = image.format.lower()
+                image_data = _decode_snapshot(snapshot_data)
 
-                # Base path: current working dir + 'snapshots' + optional dirname
-                base_path = Path.cwd() / "snapshots"
-                if dirname:
-                    base_path = base_path / dirname
-                base_path.mkdir(parents=True, exist_ok=True)
+                # Determina il formato dai magic bytes, senza decodificare l'immagine
+                image_format = _image_format(image_data)
 
                 # Crea filename con timestamp e formato corretto
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
                 filename = f"camera_{camera_id}_{timestamp}.{image_format}"
                 file_path = base_path / filename
 
-                # Salva immagine
-                image.save(file_path)
+                futures.append(self._save_pool.submit(self._write_snapshot, file_path, image_data))
+
+            except Exception as e:
+                logger.warning("Failed to save snapshot locally: %s", e)
+
+        wait(futures)
 
-                print(f"Snapshot saved locally: {file_path}")
+    @staticmethod
+    def _write_snapshot(file_path: Path, image_data: bytes):
+        """Write already decoded image bytes to file_path."""
+        try:
+            # Salva i byte originali, senza ricodificare l'immagine
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                # os.write may write less than asked: continue from a memoryview
+                # so the remaining bytes are never copied
+                view = memoryview(image_data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+            logger.debug("Snapshot saved locally: %s", file_path)
 
         except Exception as e:
-            print(f"Failed to save snapshot locally: {e}")
+            logger.warning("Failed to save snapshot locally: %s", e)
 
 
     
@@ -243,30 +461,275 @@ class SnapshotClient:
         try:
             response = self.session.get(
                 f"{self.server_url}/photos/{snapshot_path}",
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             )
-            response.raise_for_status()
-            
-            # Determine save path
-            if local_path:
-                save_path = Path(local_path)
-            else:
-                save_path = Path.cwd() / "downloaded_snapshots" / Path(snapshot_path).name
-            
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save file
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            with response:
+                response.raise_for_status()
+                
+                # Determine save path
+                if local_path:
+                    save_path = Path(local_path)
+                else:
+                    save_path = Path.cwd() / "downloaded_snapshots" / Path(snapshot_path).name
+                
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Stream the body to disk in chunks instead of holding it all in memory
+                with open(save_path, 'wb', buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
             
             return str(save_path)
             
         except requests.RequestException as e:
             raise SnapshotError(f"Failed to download snapshot: {e}")
 
+
+class AsyncSnapshotClient:
+    """
+    Asyncio client library for ROV camera snapshot system.
+
+    Same operations as SnapshotClient, as coroutines sharing a single
+    aiohttp connection pool, so concurrent requests need no extra threads.
+
+    Usage:
+        async with AsyncSnapshotClient("http://localhost:5001") as client:
+            images = await client.take_all_snapshots()
+    """
+
+    def __init__(self, server_url: str = "http://localhost:5001", timeout: int = 300):
+        """
+        Initialize the async snapshot client. The HTTP session is opened
+        by connect() or when entering the client as a context manager.
+
+        Args:
+            server_url: URL of the snapshot server (default: http://localhost:5001)
+            timeout: Request timeout in seconds (default: 300)
+        """
+        self.server_url = server_url.rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncSnapshotClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def connect(self):
+        """Open the HTTP session and check that the server is reachable."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                timeout=self.timeout
+            )
+
+        # Test connection; on failure close the session again, since
+        # __aexit__ does not run when __aenter__ raises
+        try:
+            async with self.session.get(f"{self.server_url}/api/health",
+                                        timeout=aiohttp.ClientTimeout(total=5)) as response:
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            await self.close()
+            raise SnapshotError(f"Cannot connect to snapshot server: {e}")
+
+        if status != 200:
+            await self.close()
+            raise SnapshotError(f"Server not responding correctly: {status}")
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get(self, path: str, **kwargs):
+        """GET path on the open session; the client must be connected first."""
+        if self.session is None:
+            raise SnapshotError("Client is not connected: call connect() or use 'async with'")
+        return self.session.get(f"{self.server_url}{path}", **kwargs)
+
+    async def _get_json(self, path: str, **kwargs) -> Dict[str, Any]:
+        async with self._get(path, **kwargs) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise SnapshotError(f"Invalid JSON response from {path}: {e}")
+
+    async def _get_images(self, path: str, binary: bool = False) -> Dict[int, Union[str, bytes]]:
+        """Fetch a multi-camera snapshot endpoint and map camera_id -> image data."""
+        if not binary:
+            result = await self._get_json(path)
+            return _parse_images(result.get('images', {}).get('data', []))
+
+        images = []
+        async with self._get(path, headers={"Accept": "multipart/mixed"}) as response:
+            response.raise_for_status()
+            if not response.content_type.startswith("multipart/"):
+                raise SnapshotError(f"Expected a multipart response, got {response.content_type!r}")
+
+            try:
+                reader = aiohttp.MultipartReader.from_response(response)
+                while (part := await reader.next()) is not None:
+                    images.append({
+                        "stream_id": part.headers.get("X-Stream-Id"),
+                        "image_data": bytes(await part.read())
+                    })
+            except (aiohttp.http_exceptions.HttpProcessingError, ValueError) as e:
+                raise SnapshotError(f"Malformed multipart response: {e}")
+        return _parse_images(images)
+
+    async def get_server_status(self) -> Dict[str, Any]:
+        """
+        Get server status and configuration.
+
+        Returns:
+            Dictionary containing server status information
+        """
+        try:
+            return await self._get_json("/api/health")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise SnapshotError(f"Failed to get server status: {e}")
+
+    async def take_snapshot(self, camera_id: int, save_locally: bool = True,
+                            local_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Take a snapshot from a single camera.
+
+        Args:
+            camera_id: ID of the camera (1-5)
+            save_locally: Whether to save the image locally
+            local_path: Custom local path to save the image
+
+        Returns:
+            Dictionary containing snapshot result with file paths and metadata
+        """
+        try:
+            result = await self._get_json("/api/snapshot", params={"id": str(camera_id)})
+
+            if save_locally and result:
+                await self._save_locally_many([(camera_id, result['image'])], "single")
+
+            return result
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise SnapshotError(f"Failed to take snapshot from camera {camera_id}: {e}")
+
+    async def take_all_snapshots(self, save_locally: bool = True, local_path: Optional[str] = None,
+                                 binary: bool = False,
+                                 archive_path: Optional[Union[str, Path]] = None) -> Dict[int, Union[str, bytes]]:
+        """
+        Take snapshots from all cameras via /api/snapshot_all.
+
+        Args:
+            save_locally: Whether to save images locally
+            local_path: Custom local path to save the images
+            binary: Fetch raw image bytes as multipart/mixed instead of base64 in JSON
+            archive_path: Append all images to this single .tar file instead of one file each
+                (created if missing; earlier images in it are kept)
+
+        Returns:
+            Dictionary mapping camera_id -> base64 image string (raw bytes if binary)
+        """
+        try:
+            snapshots = await self._get_images("/api/snapshot_all", binary)
+
+            if save_locally and snapshots:
+                if archive_path:
+                    await asyncio.to_thread(_save_archive, list(snapshots.items()), archive_path)
+                else:
+                    await self._save_locally_many(list(snapshots.items()), "all")
+
+            return snapshots
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise SnapshotError(f"Failed to take all snapshots: {e}")
+
+    async def take_snapshot_stereo(self, save_locally: bool = True, local_path: Optional[str] = None,
+                                   binary: bool = False) -> Dict[int, Union[str, bytes]]:
+        """
+        Take a stereo snapshot (camera 1 and 2 simultaneously) via /api/snapshot_stereo.
+
+        Args:
+            save_locally: Whether to save the images locally
+            local_path: Optional path to save the images
+            binary: Fetch raw image bytes as multipart/mixed instead of base64 in JSON
+
+        Returns:
+            Dictionary mapping camera ID -> snapshot data
+        """
+        try:
+            snapshots = await self._get_images("/api/snapshot_stereo", binary)
+
+            if save_locally and snapshots:
+                await self._save_locally_many(list(snapshots.items()), "stereo")
+
+            return snapshots
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise SnapshotError(f"Failed to take stereo snapshots: {e}")
+
+    async def take_burst_snapshots(self, count: int, interval: float = 0.0,
+                                   save_locally: bool = True) -> List[Dict[int, str]]:
+        """
+        Take a burst of snapshots from all cameras, each one started
+        `interval` seconds after the previous.
+
+        Args:
+            count: Number of snapshots in the burst
+            interval: Delay in seconds between the start of consecutive snapshots
+            save_locally: Whether to save images locally
+
+        Returns:
+            List of take_all_snapshots results, in burst order
+        """
+        async def take_one(index: int) -> Dict[int, str]:
+            await asyncio.sleep(index * interval)
+            return await self.take_all_snapshots(save_locally=save_locally)
+
+        return list(await asyncio.gather(*(take_one(i) for i in range(count))))
+
+    async def _save_locally_many(self, items: List[Tuple[int, Union[str, bytes]]], dirname: Optional[str] = None):
+        """Save several snapshots into the same folder, creating it and computing the timestamp only once."""
+        try:
+            base_path = _snapshot_dir(dirname)
+
+            # Un solo timestamp per tutto il batch
+            timestamp = _timestamp()
+        except Exception as e:
+            logger.warning("Failed to save snapshot locally: %s", e)
+            return
+
+        for camera_id, snapshot_data in items:
+            try:
+                if not snapshot_data:
+                    continue
+
+                image_data = _decode_snapshot(snapshot_data)
+                file_path = base_path / f"camera_{camera_id}_{timestamp}.{_image_format(image_data)}"
+
+                async with aiofiles.open(file_path, 'wb') as f:
+                    await f.write(image_data)
+
+                logger.debug("Snapshot saved locally: %s", file_path)
+
+            except Exception as e:
+                logger.warning("Failed to save snapshot locally: %s", e)
+
+
 if __name__ == "__main__":
     """Demo usage of the snapshot client library."""
     
+    # Show where snapshots are saved
+    logging.basicConfig(level=logging.INFO)
+    logger.setLevel(logging.DEBUG)
+
     print("=== Snapshot Client Library Demo ===")
     
     # Initialize client
@@ -1,23 +1,40 @@
 import eventlet
 eventlet.monkey_patch()
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import JSONProvider
 import os
-import json
+import pybase64
+import uuid
+import hashlib
+import orjson
 from datetime import datetime
 import logging
-import threading
-from PIL import Image, ImageDraw, ImageFont
-import asyncio
-import json
-import threading
-from flask_socketio import SocketIO, emit
-import websockets
+from flask_socketio import SocketIO
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify for every response"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes to the response directly, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json"
+        )
 
 
 app = Flask(__name__,
     template_folder='./template',  # default: 'templates'
     static_folder='./static'       # default: 'static'
 )
+app.json = OrjsonProvider(app)
 
 socketio = SocketIO(app, async_mode="eventlet", 
                     cors_allowed_origins="*", 
@@ -37,38 +54,68 @@ def index():
     except FileNotFoundError:
         return jsonify({"error": "snapshot_web_viewer.html not found"}), 404
 
+CONFIG_PATH = 'snapshot_config.json'
+
+# Served when CONFIG_PATH does not exist
+DEFAULT_CONFIG = {
+    "janus": {
+        "server": "10.0.0.192",
+        "port": 8188,
+        "use_ssl": False,
+        "websocket_path": "/janus"
+    },
+    "snapshots": {
+        "save_to_server": True,
+        "save_to_browser": True,
+        "image_quality": 0.9,
+        "image_format": "jpeg"
+    },
+    "ui": {
+        "auto_connect": True,
+        "show_fisheye_correction": True
+    }
+}
+
+# Serialized config and its ETag, valid while the file mtime is unchanged
+_config_cache = {'mtime': -1, 'body': b'', 'etag': ''}
+
+def _load_config():
+    """Return the serialized config and its ETag, re-reading the file only when it changes"""
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime != _config_cache['mtime']:
+        if mtime is None:
+            config = DEFAULT_CONFIG
+        else:
+            with open(CONFIG_PATH, 'rb') as f:
+                config = orjson.loads(f.read())
+
+        body = orjson.dumps(config)
+        _config_cache.update(
+            mtime=mtime,
+            body=body,
+            etag=hashlib.blake2b(body, digest_size=8).hexdigest()
+        )
+
+    return _config_cache['body'], _config_cache['etag']
+
 @app.route('/api/config')
 def get_config():
     """Get configuration for the web interface"""
     try:
-        with open('snapshot_config.json', 'r') as f:
-            config = json.load(f)
-        return jsonify(config)
-    except FileNotFoundError:
-        # Return default configuration
-        default_config = {
-            "janus": {
-                "server": "10.0.0.192",
-                "port": 8188,
-                "use_ssl": False,
-                "websocket_path": "/janus"
-            },
-            "snapshots": {
-                "save_to_server": True,
-                "save_to_browser": True,
-                "image_quality": 0.9,
-                "image_format": "jpeg"
-            },
-            "ui": {
-                "auto_connect": True,
-                "show_fisheye_correction": True
-            }
-        }
-        return jsonify(default_config)
+        body, etag = _load_config()
     except Exception as e:
         logger.error(f"Error loading config: {str(e)}")
         return jsonify({"error": f"Error loading config: {str(e)}"}), 500
 
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # Answers 304 Not Modified when the browser already has this version
+    return response.make_conditional(request)
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
@@ -83,106 +130,210 @@ def health_check():
     })
 
 
-### ! TAKE SNAPSHOT
+def _wants_multipart():
+    """True if the client asked for raw images as multipart/mixed instead of JSON"""
+    return request.accept_mimetypes.best_match(['application/json', 'multipart/mixed']) == 'multipart/mixed'
+
+_B64_ALPHABET = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/')
+
+def _looks_like_base64(encoded):
+    """Cheap check of length, padding and the first/last 64 characters.
+
+    Rejects obviously malformed payloads without running the decoder over
+    the whole string just to have it raise.
+    """
+    if not encoded or len(encoded) % 4:
+        return False
+
+    tail = encoded[-64:]
+    stripped_tail = tail.rstrip('=')
+    if len(tail) - len(stripped_tail) > 2:
+        return False
+
+    return (_B64_ALPHABET.issuperset(encoded[:64].rstrip('='))
+            and _B64_ALPHABET.issuperset(stripped_tail))
+
+def _part_mimetype(mimetype):
+    """Mimetype safe to put in a part header; CR/LF would let it inject headers"""
+    mimetype = str(mimetype or '').strip()
+    if not mimetype or '\r' in mimetype or '\n' in mimetype:
+        return 'application/octet-stream'
+    return mimetype
+
+def _decode_image(stream_id, image_info):
+    """Return (mimetype, raw bytes) of a viewer image, or None if it is malformed"""
+    image_data = image_info.get('image_data')
+
+    # Binary Socket.IO attachments arrive already decoded
+    if isinstance(image_data, bytes):
+        return _part_mimetype(image_info.get('content_type')), image_data
+
+    if not isinstance(image_data, str):
+        logger.error(f"Skipping malformed image from camera {stream_id}")
+        return None
 
-condition = threading.Condition()
-snapshots = {}
+    # Browser snapshots are data URLs: "data:image/jpeg;base64,<data>".
+    # The header is short, so only look for the comma near the start.
+    comma = image_data.find(',', 0, 64) if image_data.startswith('data:') else -1
+    if comma != -1:
+        mimetype = _part_mimetype(image_data[5:comma].split(';', 1)[0])
+        encoded = image_data[comma + 1:]
+    else:
+        mimetype, encoded = 'application/octet-stream', image_data
+
+    if not _looks_like_base64(encoded):
+        logger.error(f"Skipping malformed image from camera {stream_id}")
+        return None
+
+    try:
+        return mimetype, pybase64.b64decode(encoded, validate=True)
+    except ValueError as e:
+        logger.error(f"Skipping malformed image from camera {stream_id}: {str(e)}")
+        return None
+
+def _as_data_urls(images):
+    """Turn binary images into data URLs in place, for the JSON responses"""
+    for image_info in images:
+        image_data = image_info.get('image_data')
+        if isinstance(image_data, bytes):
+            mimetype = image_info.pop('content_type', None) or 'application/octet-stream'
+            image_info['image_data'] = f"data:{mimetype};base64,{pybase64.b64encode(image_data).decode()}"
+    return images
+
+def _multipart_response(images):
+    """Build a multipart/mixed response with one raw image part per camera.
+
+    Each part carries the camera id in an X-Stream-Id header and the decoded
+    image bytes as body, so no base64 travels over the wire.
+    """
+    boundary = uuid.uuid4().hex
+    body = []
+    for image_info in images:
+        stream_id = image_info.get('stream_id')
+        if stream_id is None or not image_info.get('image_data'):
+            continue
+
+        # The viewer may send ids as numbers or strings; the part header
+        # always carries the string form
+        stream_id = str(stream_id).strip()
+        if '\r' in stream_id or '\n' in stream_id:
+            logger.error(f"Skipping image with invalid camera id {stream_id!r}")
+            continue
+
+        decoded = _decode_image(stream_id, image_info)
+        if decoded is None:
+            continue
+        mimetype, raw = decoded
+
+        body.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: {mimetype}\r\n"
+            f"X-Stream-Id: {stream_id}\r\n\r\n".encode()
+        )
+        body.append(raw)
+        body.append(b"\r\n")
+    body.append(f"--{boundary}--\r\n".encode())
+
+    return Response(b"".join(body), status=200,
+                    content_type=f"multipart/mixed; boundary={boundary}")
+
+
+### ! CAPTURE REQUESTS
+
+# ticket -> queue of the HTTP request waiting for the viewer response
+# carrying that ticket
+inbox = {}
+
+def _request_capture(event, payload, timeout):
+    """Ask the viewer for a capture and wait for the reply tagged with our ticket.
+
+    Returns None if no reply arrives within timeout seconds.
+    """
+    ticket = uuid.uuid4().hex
+    queue = eventlet.queue.Queue(1)
+    inbox[ticket] = queue
+    try:
+        socketio.emit(event, dict(payload, tok=ticket))
+        return queue.get(timeout=timeout)
+    except eventlet.queue.Empty:
+        return None
+    finally:
+        inbox.pop(ticket, None)
+
+def _deliver(ticket, data):
+    """Hand a viewer reply to the request waiting on ticket, if it is still waiting"""
+    queue = inbox.pop(ticket, None)
+    if queue is not None:
+        queue.put_nowait(data)
+
+
+### ! TAKE SNAPSHOT
 
 @app.route('/api/snapshot')
 def snapshot():
-    camera_id = request.args.get('id')
+    # Ids are strings end to end: the viewer looks cameras up by
+    # their element id, so normalise whatever the caller sent here
+    camera_id = request.args.get('id', '').strip()
     if not camera_id:
         return jsonify({'error': 'Missing id'}), 400
 
-    with condition:
-        snapshots.pop(camera_id, None)
-        socketio.emit('take_snapshot', {'id': camera_id})
-
-        received = condition.wait(timeout=5)  
-        if not received or camera_id not in snapshots:
-            return jsonify({'error': 'Timeout or no snapshot received'}), 504
+    img_base64 = _request_capture('take_snapshot', {'id': camera_id}, timeout=5)
+    if not img_base64:
+        return jsonify({'error': 'Timeout or no snapshot received'}), 504
 
-        img_base64 = snapshots.pop(camera_id)
-        return jsonify({'image': img_base64}), 200
+    return jsonify({'image': img_base64}), 200
 
 @socketio.on('snapshot_response')
 def handle_snapshot_response(data):
-    camera_id = data.get('id')
     img_base64 = data.get('image')
 
-    if camera_id and img_base64:
-        with condition:
-            snapshots[camera_id] = img_base64
-            condition.notify_all()
+    if img_base64:
+        _deliver(data.get('tok'), img_base64)
 
 ### ! TAKE ALL SNAPSHOT
 
 
-condition_all = threading.Condition()
-snapshots_all = {} 
-
 @app.route('/api/snapshot_all')
 def snapshot_all():
-    with condition_all:
-        snapshots_all.clear()
-
-        socketio.emit('take_all_snapshot')
+    snapshots_all = _request_capture('take_all_snapshot', {}, timeout=8)
+    if not snapshots_all:
+        return jsonify({'error': 'Timeout or no snapshots received'}), 504
 
-        received = condition_all.wait(timeout=8)
+    if _wants_multipart():
+        return _multipart_response(snapshots_all.get('data', []))
 
-
-        if not received or not snapshots_all:
-            return jsonify({'error': 'Timeout or no snapshots received'}), 504
-
-        return jsonify({'images': snapshots_all}), 200
+    return jsonify({'images': snapshots_all}), 200
 
 @socketio.on('snapshots_all_response')
 def handle_snapshots_all_response(data):
-    images = data
-    if isinstance(images, dict) and images:
-        with condition_all:
-            snapshots_all.update(images)
-            condition_all.notify_all()
-
-def run_async(func):
-    return asyncio.run(func)
-
+    if isinstance(data, dict) and data:
+        ticket = data.pop('tok', None)
+        _deliver(ticket, data)
 
 ### ! TAKE STEREO CAMERA
 
-condition_stereo = threading.Condition()
-snapshots_stereo = {} 
-
 @app.route('/api/snapshot_stereo')
 def snapshot_stereo():
-    with condition_stereo:
-        snapshots_stereo.clear()
-        # Trigger client-side snapshot for camera 1 and 2
-        socketio.emit('take_stereo_snapshot')
+    # Trigger client-side snapshot for camera 1 and 2 and wait for both.
+    # The viewer sends them as binary attachments, not base64 strings.
+    snapshots_stereo = _request_capture('take_stereo_snapshot', {'binary': True}, timeout=8)
 
-        # Wait for both snapshots
-        received = condition_stereo.wait(timeout=8)
+    if snapshots_stereo is None:
+        return jsonify({'error': 'Timeout or incomplete stereo snapshots'}), 504
 
-        if not received:
-            return jsonify({'error': 'Timeout or incomplete stereo snapshots'}), 504
+    if _wants_multipart():
+        return _multipart_response(snapshots_stereo.get('data', []))
 
-        return jsonify({'images': snapshots_stereo}), 200
+    # JSON callers still get data URLs, as before
+    _as_data_urls(snapshots_stereo.get('data', []))
+    return jsonify({'images': snapshots_stereo}), 200
 
 @socketio.on('snapshots_stereo_response')
 def handle_snapshots_stereo_response(data):
 
     if isinstance(data, dict) and data:
-        with condition_stereo:
-            print(data)
-            snapshots_stereo.update(data)
-            condition_stereo.notify_all()
-
-
-def run_async(func):
-    return asyncio.run(func)
-
-
-
+        ticket = data.pop('tok', None)
+        _deliver(ticket, data)
 
 
 @socketio.on("connect")